@@ -10,6 +10,12 @@ python3 foamBatchGen.py --csv runs.csv --ref ref --out ./cases_out --map mapping
   [--overwrite]            : overwrite existing case directories
   [--only CASE1,CASE2]     : only build specified case_name(s) from the CSV (comma-separated)
   [--verbose]              : print more details
+  [--jobs N]               : number of cases to build in parallel (default: CPU count)
+  [--copy-jobs N]          : threads used to copy files within one case (default: 1, plain copytree)
+  [--tar-ref]              : read the reference case once into an in-memory tar and extract it per case
+  [--reflink MODE]         : auto|always|never — clone file data (copy-on-write) when the filesystem allows (default: auto)
+  [--link-dirs D1,D2]      : hard-link these read-only reference subdirectories (e.g. constant/polyMesh) instead of copying
+  [--fsync MODE]           : never|per-case|per-file — when to fsync edited files (default: never)
 
 CSV FORMAT
 ----------
@@ -64,117 +70,798 @@ NOTES
 """
 
 import argparse
+import contextlib
 import csv
+import errno
+import functools
+import io
+import itertools
 import json
+import mmap
 import os
 import re
 import shutil
 import sys
+import tarfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import re2 as _re2  # optional: pip install google-re2
+except ImportError:
+    _re2 = None
+
+try:
+    import numba  # optional: pip install numba (pulls in numpy)
+    import numpy as np
+except ImportError:
+    numba = None
+
+# A CSV data row; ops read it by column position resolved once in build_plan
+Row = List[str]
+# Edited file contents collected during a case, written together by write_case_files
+PendingWrites = List[Tuple[Union[str, Path], bytes]]
+# edit_case(row, dest, dry_run, writes) as produced by generate_case_editor
+CaseEditor = Callable[[Row, str, bool, Optional[PendingWrites]], None]
+
+# Files at least this large are mapped (mmap) for editing instead of read into a buffer
+_MMAP_THRESHOLD = 256 * 1024
+
+# Linux ioctl that makes dst share src's data blocks (btrfs, xfs, ...): _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+# In-memory tar of the reference case, set in each pool worker by _init_worker when --tar-ref is used
+_REF_BLOB: Optional[bytes] = None
+# Straight-line editor generated from the plan, set in each pool worker by _init_worker
+_CASE_EDITOR: Optional[CaseEditor] = None
+# Update plan, set in each pool worker by _init_worker so it is not pickled into every task
+_PLAN: "Optional[Plan]" = None
 
 def read_mapping(map_path: Path) -> Dict[str, Any]:
     with open(map_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def read_csv(csv_path: Path) -> List[Dict[str, str]]:
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    if not rows:
-        raise ValueError("CSV is empty.")
-    if "case_name" not in rows[0]:
-        raise ValueError('CSV must include a "case_name" column (first column recommended).')
-    return rows
-
-def copy_reference_case(ref_path: Path, dest_path: Path, overwrite: bool) -> None:
+def read_csv(csv_path: Path) -> Tuple[List[str], Iterator[Row]]:
+    """
+    Validate the header and first row eagerly, then stream the remaining rows lazily
+    so large sweeps are never held in memory at once. Returns (fieldnames, rows), with
+    rows as plain lists in header order.
+    """
+    f = open(csv_path, newline="", encoding="utf-8")
+    try:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+        rows = _iter_csv_rows(f, reader)
+        first = next(rows, None)
+        if first is None:
+            raise ValueError("CSV is empty.")
+        if "case_name" not in fieldnames:
+            raise ValueError('CSV must include a "case_name" column (first column recommended).')
+    except BaseException:
+        f.close()
+        raise
+    return fieldnames, itertools.chain([first], rows)
+
+def _iter_csv_rows(f: TextIO, reader: Iterator[Row]) -> Iterator[Row]:
+    with f:
+        for row in reader:
+            # Blank lines carry no case (csv.DictReader skipped them too)
+            if row:
+                yield row
+
+# (source st_dev, destination st_dev) pairs on which FICLONE has already failed, so
+# later files skip straight to the fallback instead of opening both files twice
+_NO_CLONE_DEVS: Set[Tuple[int, int]] = set()
+_NO_CLONE_ERRNOS = {errno.EOPNOTSUPP, errno.EXDEV, errno.ENOTTY, errno.EINVAL, errno.ENOSYS}
+
+def _clone_file(src: str, dst: str) -> bool:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    devs = (os.stat(src).st_dev, os.stat(os.path.dirname(dst) or os.curdir).st_dev)
+    if devs in _NO_CLONE_DEVS:
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in _NO_CLONE_ERRNOS:
+                _NO_CLONE_DEVS.add(devs)
+            return False
+    return True
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    # In-kernel copy; the kernel may itself reflink or offload it on capable filesystems
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        copied = 0
+        while True:
+            try:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+            except OSError:
+                if copied:
+                    raise
+                return False
+            if n == 0:
+                break
+            copied += n
+    return True
+
+def copy_file(src: str, dst: str, reflink: str = "auto") -> str:
+    """
+    Drop-in for shutil.copy2 (usable as copytree's copy_function) that tries a copy-on-write
+    clone first. reflink: "auto" tries a clone, then copy_file_range, then shutil.copy2
+    (which uses sendfile on Linux); "always" fails if the clone is not possible;
+    "never" is plain shutil.copy2.
+    """
+    if reflink != "never" and _clone_file(src, dst):
+        shutil.copystat(src, dst)
+        return dst
+    if reflink == "always":
+        raise OSError(errno.EOPNOTSUPP, "Reflink copy not supported", src)
+    if reflink == "auto" and _copy_file_range(src, dst):
+        shutil.copystat(src, dst)
+        return dst
+    return shutil.copy2(src, dst)
+
+def _link_or_copy(src: str, dst: str, fallback: Callable[[str, str], Any]) -> None:
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        # Other device, no hard-link support, or the inode's link count is exhausted
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP):
+            raise
+        fallback(src, dst)
+
+def _copy_entry(src: str, dst: str, copy_function: Callable[[str, str], Any]) -> None:
+    if os.path.islink(src):
+        os.symlink(os.readlink(src), dst)
+    else:
+        copy_function(src, dst)
+
+def parallel_copytree(src: Path, dst: Path, max_workers: int, copy_function: Callable[[str, str], Any] = shutil.copy2,
+                      exclude: Tuple[str, ...] = ()) -> None:
+    """
+    Equivalent of shutil.copytree(src, dst, symlinks=True), but individual files are copied
+    on a thread pool. Directories are created up front in walk order; their metadata is
+    copied last so file writes do not disturb directory mtimes. `exclude` lists
+    directories (relative to src) that are skipped entirely.
+    """
+    src_root = os.fspath(src)
+    dst_root = os.fspath(dst)
+    dirs = []
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = []
+        for root, dirnames, filenames in os.walk(src_root):
+            rel = os.path.relpath(root, src_root)
+            droot = dst_root if rel == os.curdir else os.path.join(dst_root, rel)
+            os.makedirs(droot)
+            dirs.append((root, droot))
+            if exclude:
+                dirnames[:] = [d for d in dirnames if os.path.normpath(os.path.join(rel, d)) not in exclude]
+            # Symlinked directories are recreated as links, not descended into
+            linked = [d for d in dirnames if os.path.islink(os.path.join(root, d))]
+            dirnames[:] = [d for d in dirnames if d not in linked]
+            for name in filenames + linked:
+                futures.append(ex.submit(_copy_entry, os.path.join(root, name), os.path.join(droot, name), copy_function))
+        for fut in futures:
+            fut.result()
+    for sdir, ddir in reversed(dirs):
+        shutil.copystat(sdir, ddir)
+
+def snapshot_reference_case(ref_path: Path, exclude: Tuple[str, ...] = ()) -> bytes:
+    """
+    Read the whole reference case once into an uncompressed tar held in memory.
+    Symlinks are stored as links, matching copytree(symlinks=True). Directories in
+    `exclude` (relative to ref_path) are left out.
+    """
+    def skip_excluded(info: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+        return None if os.path.normpath(info.name) in exclude else info
+    blob = io.BytesIO()
+    with tarfile.open(fileobj=blob, mode="w") as t:
+        t.add(ref_path, arcname=".", filter=skip_excluded)
+    return blob.getvalue()
+
+def extract_reference_case(ref_blob: bytes, dest_path: Path) -> None:
+    dest_path.mkdir(parents=True)
+    with tarfile.open(fileobj=io.BytesIO(ref_blob), mode="r") as t:
+        # The archive is our own snapshot of the reference, so links pointing outside
+        # the case (e.g. a shared mesh) are kept as-is, like copytree would
+        if hasattr(tarfile, "fully_trusted_filter"):
+            t.extractall(dest_path, filter="fully_trusted")
+        else:
+            t.extractall(dest_path)
+
+def copy_reference_case(ref_path: Path, dest_path: Path, overwrite: bool, copy_jobs: int = 1, ref_blob: Optional[bytes] = None,
+                        reflink: str = "never", link_dirs: Tuple[str, ...] = ()) -> None:
+    """
+    Copy the reference case to dest_path. Subdirectories in link_dirs (see resolve_link_dirs)
+    are not copied; their files are hard-linked to the reference instead. When ref_blob is
+    given it must have been snapshotted with link_dirs excluded.
+    """
     if dest_path.exists():
         if overwrite:
             shutil.rmtree(dest_path)
         else:
             raise FileExistsError(f"Destination already exists: {dest_path}")
-    shutil.copytree(ref_path, dest_path, symlinks=True)
+    copy_function = functools.partial(copy_file, reflink=reflink)
+    if ref_blob is not None:
+        extract_reference_case(ref_blob, dest_path)
+    elif copy_jobs > 1:
+        parallel_copytree(ref_path, dest_path, max_workers=copy_jobs, copy_function=copy_function, exclude=link_dirs)
+    else:
+        excluded = {os.path.join(os.fspath(ref_path), rel) for rel in link_dirs}
+        def ignore_link_dirs(d: str, names: List[str]) -> List[str]:
+            return [n for n in names if os.path.join(d, n) in excluded]
+        shutil.copytree(ref_path, dest_path, symlinks=True, copy_function=copy_function,
+                        ignore=ignore_link_dirs if link_dirs else None)
+    link_function = functools.partial(_link_or_copy, fallback=copy_function)
+    for rel in link_dirs:
+        parallel_copytree(ref_path / rel, dest_path / rel, max_workers=copy_jobs, copy_function=link_function)
+
+@functools.lru_cache(maxsize=None)
+def _compile_key(key: str) -> "re.Pattern[bytes]":
+    # Files are read as bytes (no newline translation), hence the optional \r before $
+    return re.compile(rb'(?m)^(\s*' + re.escape(key.encode("utf-8")) + rb'\s+)(.*?)(\s*;)([^\n\r]*)(?=\r?$)')
 
-def set_foam_key(text: str, key: str, value: str) -> str:
+@functools.lru_cache(maxsize=None)
+def _compile_keys(keys: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    # Same shape as _compile_key, with the key captured in group 2 out of an alternation
+    alternation = b"|".join(re.escape(k.encode("utf-8")) for k in keys)
+    return re.compile(rb'(?m)^(\s*(' + alternation + rb')\s+)(.*?)(\s*;)([^\n\r]*)(?=\r?$)')
+
+@functools.lru_cache(maxsize=None)
+def _compile_regex(pattern: str, engine: str = "re") -> "re.Pattern[bytes]":
+    """
+    Compile a user-supplied pattern as a multiline bytes pattern (files are edited as bytes).
+    engine="re2" (opt-in, requires google-re2) runs the pattern on RE2, which is linear-time
+    so a pathological pattern cannot backtrack forever; patterns RE2 rejects (backreferences,
+    lookaround) fall back to re. RE2 is not a drop-in replacement: e.g. `a{,3}` is a literal
+    in RE2 but `a{0,3}` in re, and empty matches next to a previous match (`\\s*$` on
+    b"ab  \\ncd") are substituted differently. The cache is unbounded, unlike re's, so large
+    mappings do not churn.
+    """
+    raw = pattern.encode("utf-8")
+    if engine == "re2":
+        options = _re2.Options()
+        options.log_errors = False
+        try:
+            return _re2.compile(b"(?m)" + raw, options)
+        except _re2.error:
+            pass
+    return re.compile(raw, re.MULTILINE)
+
+def _scan_key(buf, key):
+    """
+    Locate the value that _compile_key's pattern would replace, by a single linear scan.
+    buf and key are sequences of byte values (bytes, or uint8 arrays when jitted by numba).
+    Returns (start, end) of the old value, (-1, -1) if the key is not found, or (-2, -2)
+    for layouts where the regex could match across lines (or after a stray \r);
+    callers then fall back to the regex.
+    """
+    n = len(buf)
+    k = len(key)
+    i = 0
+    while i < n:
+        # i is at a line start: skip leading whitespace other than \n
+        j = i
+        while j < n and (buf[j] == 32 or (9 <= buf[j] <= 13 and buf[j] != 10)):
+            j += 1
+        if j + k < n:
+            m = 0
+            while m < k and buf[j + m] == key[m]:
+                m += 1
+            if m == k:
+                p = j + k
+                c = buf[p]
+                if c == 10 or c == 13:
+                    return -2, -2
+                if c == 32 or c == 9 or c == 11 or c == 12:
+                    while p < n and (buf[p] == 32 or buf[p] == 9 or buf[p] == 11 or buf[p] == 12):
+                        p += 1
+                    if p >= n or buf[p] == 10 or buf[p] == 13:
+                        return -2, -2
+                    start = p
+                    while p < n and buf[p] != 59 and buf[p] != 10:  # ';', '\n'
+                        p += 1
+                    if p < n and buf[p] == 59:
+                        q = p + 1
+                        while q < n and buf[q] != 10 and buf[q] != 13:
+                            q += 1
+                        if q < n and buf[q] == 13 and q + 1 < n and buf[q + 1] != 10:
+                            return -2, -2
+                        end = p
+                        while end > start and (buf[end - 1] == 32 or (9 <= buf[end - 1] <= 13 and buf[end - 1] != 10)):
+                            end -= 1
+                        return start, end
+                    # No ';' on this line: the regex may still reach one on a later line
+                    return -2, -2
+        while i < n and buf[i] != 10:
+            i += 1
+        i += 1
+    return -1, -1
+
+if numba is not None:
+    _scan_key_jit = numba.njit(cache=True)(_scan_key)
+
+_LEADING_WS = frozenset(b" \t\r\x0b\x0c")  # \s minus \n
+_INLINE_WS = frozenset(b" \t\x0b\x0c")
+
+def _find_key_value(buf: bytes, key: bytes) -> Tuple[int, int]:
+    """
+    Same contract as _scan_key, but jumps between occurrences of the key with bytes.find
+    and only inspects the few bytes around each one, so no per-byte Python loop runs
+    over the rest of the file.
+    """
+    n = len(buf)
+    k = len(key)
+    pos = 0
+    while True:
+        idx = buf.find(key, pos)
+        if idx < 0:
+            return -1, -1
+        # Only a key preceded by nothing but whitespace on its line counts, so a line
+        # holds at most one candidate: after a miss, resume on the next line
+        nl = buf.find(b"\n", idx)
+        pos = n if nl < 0 else nl + 1
+        j = idx
+        while j > 0 and buf[j - 1] in _LEADING_WS:
+            j -= 1
+        p = idx + k
+        if (j > 0 and buf[j - 1] != 10) or p >= n:
+            continue
+        c = buf[p]
+        if c == 10 or c == 13:
+            return -2, -2
+        if c not in _INLINE_WS:
+            continue
+        while p < n and buf[p] in _INLINE_WS:
+            p += 1
+        if p >= n or buf[p] == 10 or buf[p] == 13:
+            return -2, -2
+        line_end = buf.find(b"\n", p)
+        if line_end < 0:
+            line_end = n
+        semi = buf.find(b";", p, line_end)
+        if semi < 0:
+            # The regex may still reach a ';' on a later line
+            return -2, -2
+        cr = buf.find(b"\r", semi + 1, line_end)
+        if cr >= 0 and cr + 1 < n and buf[cr + 1] != 10:
+            return -2, -2
+        end = semi
+        while end > p and buf[end - 1] in _LEADING_WS:
+            end -= 1
+        return p, end
+
+def splice_key(buf: bytes, key: bytes, value: bytes) -> Optional[bytes]:
+    """
+    Regex-free value replacement for a simple key: the numba-compiled scanner when numba
+    is installed, otherwise _find_key_value. Returns None when the key is missing or the
+    layout is ambiguous, so callers can fall back to the regex.
+    """
+    if numba is not None:
+        start, end = _scan_key_jit(np.frombuffer(buf, dtype=np.uint8), np.frombuffer(key, dtype=np.uint8))
+    else:
+        start, end = _find_key_value(buf, key)
+    if start < 0:
+        return None
+    return buf[:start] + value + buf[end:]
+
+def _is_simple_key(key: str) -> bool:
+    # Keys splice_key can match byte-for-byte: a single non-empty token
+    return bool(key) and ";" not in key and not any(ch.isspace() for ch in key)
+
+def set_foam_key(data: bytes, key: str, value: bytes, pattern: Optional["re.Pattern[bytes]"] = None, simple: bool = False) -> bytes:
     """
     Replace 'key  oldvalue;' with 'key  value;' (value inserted as given).
     Preserves leading whitespace and trailing comment on the same line.
     Matches the first occurrence of 'key' as a standalone token followed by anything up to ';'.
+    `simple` (see _is_simple_key) lets splice_key try a regex-free scan first.
     """
-    pattern = re.compile(rf'(?m)^(\s*{re.escape(key)}\s+)(.*?)(\s*;)([^\n\r]*)$')
+    if simple:
+        new_data = splice_key(data, key.encode("utf-8"), value)
+        if new_data is not None:
+            return new_data
+    if pattern is None:
+        pattern = _compile_key(key)
     def repl(m):
         before, oldval, semi, after = m.groups()
-        return f"{before}{value}{semi}{after}"
-    new_text, n = pattern.subn(repl, text, count=1)
+        return before + value + semi + after
+    new_data, n = pattern.subn(repl, data, count=1)
     if n == 0:
         raise KeyError(f"Key '{key}' not found")
-    return new_text
+    return new_data
+
+def set_foam_keys(data: bytes, values: Dict[str, bytes], pattern: Optional["re.Pattern[bytes]"] = None, simple: bool = False) -> bytes:
+    """
+    Multi-key version of set_foam_key: replace the first occurrence of every key in
+    `values` (key->value) during a single scan of the text. With `simple`, each key is
+    spliced by splice_key instead, falling back to the regex if any key is undecided.
+    """
+    if simple:
+        new_data = data
+        for key, value in values.items():
+            new_data = splice_key(new_data, key.encode("utf-8"), value)
+            if new_data is None:
+                break
+        else:
+            return new_data
+    if pattern is None:
+        pattern = _compile_keys(tuple(values))
+    done = set()
+    def repl(m):
+        before, key, oldval, semi, after = m.groups()
+        key = key.decode("utf-8")
+        if key in done:
+            return m.group(0)
+        done.add(key)
+        return before + values[key] + semi + after
+    new_data = pattern.sub(repl, data)
+    for key in values:
+        if key not in done:
+            raise KeyError(f"Key '{key}' not found")
+    return new_data
 
-def apply_regex(text: str, pattern: str, replacement: str, params_map: Dict[str, str], row: Dict[str, str]) -> str:
+def apply_regex(data: bytes, pattern: Union[str, "re.Pattern[bytes]"], replacement: str, params_map: Dict[str, int], row: Row) -> bytes:
     """
-    Apply regex with optional {placeholders} formatted from the row using params_map (name->csv_column).
+    Apply regex with optional {placeholders} formatted from the row using params_map (name->column index).
     """
-    # Build format dict from mapping
-    fmt = {}
-    for name, csv_col in (params_map or {}).items():
-        if csv_col not in row:
-            raise KeyError(f"Mapping references CSV column '{csv_col}' which is missing in the row")
-        fmt[name] = row[csv_col]
+    # Build format dict from mapping; indices were resolved against the header in build_plan
+    fmt = {name: row[col] for name, col in (params_map or {}).items()}
     try:
         replacement_fmt = replacement.format(**fmt)
     except KeyError as e:
         raise KeyError(f"Replacement placeholder {e} not provided in params") from e
-    return re.sub(pattern, replacement_fmt, text, flags=re.MULTILINE)
-
-def apply_updates_to_file(file_path: Path, updates: List[Dict[str, Any]], row: Dict[str, str], dry_run: bool, verbose: bool) -> None:
-    # Read text
-    with open(file_path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    original_text = text
-    for upd in updates:
-        utype = upd.get("type")
-        if utype == "key":
-            key = upd["key"]
-            param = upd["param"]
-            if param not in row:
-                raise KeyError(f"CSV missing column '{param}' required for key '{key}' in {file_path}")
-            value = row[param]
-            if verbose:
-                print(f"  - set key {key} = {value}")
-            text = set_foam_key(text, key, value)
-        elif utype == "regex":
-            pattern = upd["pattern"]
-            replacement = upd["replacement"]
-            params_map = upd.get("params", {})
-            if verbose:
-                print(f"  - regex {pattern} -> {replacement}")
-            text = apply_regex(text, pattern, replacement, params_map, row)
+    if isinstance(pattern, str):
+        pattern = _compile_regex(pattern)
+    if not isinstance(pattern, re.Pattern) and not isinstance(data, bytes):
+        # RE2 only scans real bytes, not an mmap handed over by edit_file
+        data = bytes(data)
+    return pattern.sub(replacement_fmt.encode("utf-8"), data)
+
+@dataclass(slots=True)
+class KeyOp:
+    """A "type": "key" update with its pattern compiled up front."""
+    key: str
+    col: int
+    pattern: "re.Pattern[bytes]"
+    simple: bool = False
+
+    def describe(self, row: Row) -> List[str]:
+        return [f"set key {self.key} = {row[self.col]}"]
+
+    def apply(self, data: bytes, row: Row) -> bytes:
+        return set_foam_key(data, self.key, row[self.col].encode("utf-8"), pattern=self.pattern, simple=self.simple)
+
+@dataclass(slots=True)
+class RegexOp:
+    """A "type": "regex" update with its pattern compiled up front (re or RE2)."""
+    source: str
+    pattern: "re.Pattern[bytes]"
+    replacement: str
+    params_map: Dict[str, int]  # placeholder -> column index
+
+    def describe(self, row: Row) -> List[str]:
+        return [f"regex {self.source} -> {self.replacement}"]
+
+    def apply(self, data: bytes, row: Row) -> bytes:
+        return apply_regex(data, self.pattern, self.replacement, self.params_map, row)
+
+@dataclass(slots=True)
+class MultiKeyOp:
+    """Consecutive "type": "key" updates of one file, applied in a single pass."""
+    cols: Dict[str, int]  # key -> column index
+    pattern: "re.Pattern[bytes]"
+    simple: bool = False
+
+    def describe(self, row: Row) -> List[str]:
+        return [f"set key {key} = {row[col]}" for key, col in self.cols.items()]
+
+    def apply(self, data: bytes, row: Row) -> bytes:
+        values = {key: row[col].encode("utf-8") for key, col in self.cols.items()}
+        return set_foam_keys(data, values, pattern=self.pattern, simple=self.simple)
+
+Op = Union[KeyOp, MultiKeyOp, RegexOp]
+# One entry per mapped file: (path relative to the case, ops applied in order)
+Plan = List[Tuple[str, List[Op]]]
+
+def build_plan(mapping: Dict[str, Any], fieldnames: List[str], regex_engine: str = "re") -> Plan:
+    """
+    Resolve the mapping once into typed ops, so rows only walk pre-compiled updates.
+    CSV columns are resolved to indices in `fieldnames`; unknown update types and every
+    missing column are reported here, once, instead of in every case. Entries that name
+    the same file are merged (in mapping order) so each file is read and written once.
+    regex_engine selects the engine for "regex" updates (see _compile_regex).
+    """
+    index = {name: i for i, name in enumerate(fieldnames)}
+    missing: List[str] = []
+    def col(name: str) -> int:
+        if name not in index:
+            if name not in missing:
+                missing.append(name)
+            return -1
+        return index[name]
+
+    by_path: Dict[str, List[Op]] = {}
+    for fdesc in mapping.get("files", []):
+        ops = by_path.setdefault(os.path.normpath(fdesc["path"]), [])
+        for upd in fdesc.get("updates", []):
+            utype = upd.get("type")
+            if utype == "key":
+                key = upd["key"]
+                ops.append(KeyOp(key, col(upd["param"]), _compile_key(key), _is_simple_key(key)))
+            elif utype == "regex":
+                params_map = {name: col(csv_col) for name, csv_col in (upd.get("params") or {}).items()}
+                ops.append(RegexOp(upd["pattern"], _compile_regex(upd["pattern"], regex_engine), upd["replacement"], params_map))
+            else:
+                raise ValueError(f"Unknown update type: {utype}")
+    if missing:
+        raise ValueError(f"CSV is missing column(s) referenced by the mapping: {', '.join(missing)}")
+    return [(rel, _merge_key_ops(ops)) for rel, ops in by_path.items()]
+
+def _merge_key_ops(ops: List[Op]) -> List[Op]:
+    """
+    Fold each run of consecutive KeyOps into one MultiKeyOp so the file is scanned once
+    per run rather than once per key. Runs are not reordered around regex updates.
+    """
+    merged: List[Op] = []
+    run: List[KeyOp] = []
+    def flush():
+        if len(run) == 1:
+            merged.append(run[0])
+        elif run:
+            # A key listed twice keeps its last column, as sequential updates would
+            cols = {op.key: op.col for op in run}
+            merged.append(MultiKeyOp(cols, _compile_keys(tuple(cols)), all(op.simple for op in run)))
+        run.clear()
+    for op in ops:
+        if isinstance(op, KeyOp):
+            run.append(op)
         else:
-            raise ValueError(f"Unknown update type: {utype}")
+            flush()
+            merged.append(op)
+    flush()
+    return merged
+
+def _is_within(path: str, directory: str) -> bool:
+    return path == directory or path.startswith(directory + os.sep)
+
+def resolve_link_dirs(spec: str, ref_path: Path, plan: Plan) -> Tuple[str, ...]:
+    """
+    Normalize the comma-separated --link-dirs value into paths relative to the reference.
+    Hard-linked files share their data with the reference and every other case, so a
+    directory holding a file the mapping edits is refused.
+    """
+    dirs: List[str] = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        rel = os.path.normpath(entry)
+        if os.path.isabs(rel) or rel == os.curdir or _is_within(rel, os.pardir):
+            raise ValueError(f"--link-dirs entry must be inside the reference case: {entry}")
+        if not (ref_path / rel).is_dir() or (ref_path / rel).is_symlink():
+            raise ValueError(f"--link-dirs entry is not a directory of the reference case: {entry}")
+        dirs.append(rel)
+    # A directory inside another listed one is linked along with its parent
+    dirs = [d for d in dict.fromkeys(dirs) if not any(d != o and _is_within(d, o) for o in dirs)]
+    for rel, ops in plan:
+        for d in dirs:
+            if ops and _is_within(rel, d):
+                raise ValueError(f"Mapping edits {rel}, which is inside --link-dirs directory {d}")
+    return tuple(dirs)
 
-    if text != original_text and not dry_run:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(text)
+def _edit_lf(data: bytes, edit: Callable[[bytes, Row], bytes], row: Row) -> bytes:
+    # What text mode did before files were edited as bytes, minus rewriting CRLF files to LF
+    if data.find(b"\r\n") == -1:
+        return edit(data, row)
+    lf = data[:].replace(b"\r\n", b"\n")
+    new = edit(lf, row)
+    # Untouched files are left byte-for-byte as they were, even with mixed line endings
+    return data if new == lf else new.replace(b"\n", b"\r\n")
+
+def edit_file(file_path: Union[str, Path], edit: Callable[[bytes, Row], bytes], row: Row, dry_run: bool,
+              writes: Optional[PendingWrites] = None) -> bool:
+    """
+    Run edit(content, row) on the file's raw bytes and write the result back if it changed.
+    Files of _MMAP_THRESHOLD bytes or more are memory-mapped rather than read, so the only
+    full-size copy is the edited result (and none when an edit leaves the content as is).
+    When `writes` is given the new content is appended to it instead of being written.
+    Files with CRLF line endings are edited as LF and converted back, so user patterns such
+    as `^x=.*$` cannot leave a mix of CRLF and LF lines behind. Returns whether the content changed.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            data = f.read()
+            new = _edit_lf(data, edit, row)
+            changed = new != data
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                new = _edit_lf(mm, edit, row)
+                with memoryview(mm) as view:
+                    changed = view != new
+    # Written only after the mapping is closed, since writing truncates the file
+    if changed and not dry_run:
+        if writes is not None:
+            writes.append((file_path, new))
+        else:
+            with open(file_path, "wb") as f:
+                f.write(new)
+    return changed
 
-def build_case(row: Dict[str, str], ref: Path, out_dir: Path, mapping: Dict[str, Any], overwrite: bool, dry_run: bool, verbose: bool) -> None:
-    case_name = row["case_name"]
+def _fsync_path(path: str, flags: int = os.O_RDONLY) -> None:
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def fsync_tree(root: Union[str, Path]) -> None:
+    """
+    Make a whole case durable: fsync every regular file, then every directory bottom-up so
+    each directory entry is persisted after what it points to. Symlinks are not followed.
+    POSIX only (main rejects --fsync elsewhere): Windows can neither fsync a read-only
+    handle nor open a directory.
+    """
+    for dirpath, _, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if not os.path.islink(path):
+                _fsync_path(path)
+        _fsync_path(dirpath, os.O_RDONLY | os.O_DIRECTORY)
+
+def write_case_files(writes: PendingWrites, case_dir: Path, fsync: str) -> None:
+    """
+    Write the edited files of one case, collected by build_case when an fsync mode is set,
+    then make the whole case (copied files, edited files and directories) durable.
+    fsync: "per-file" also syncs each edited file as soon as it is written;
+    "per-case" writes everything first so the kernel can flush it together.
+    """
+    for path, data in writes:
+        with open(path, "wb") as f:
+            f.write(data)
+            if fsync == "per-file":
+                f.flush()
+                os.fsync(f.fileno())
+    fsync_tree(case_dir)
+
+def apply_updates_to_file(file_path: Union[str, Path], ops: List[Op], row: Row, dry_run: bool, verbose: bool,
+                          writes: Optional[PendingWrites] = None) -> None:
+    # Edit raw bytes: values are inserted verbatim, so there is nothing to gain from decoding
+    def edit(data: bytes, row: Row) -> bytes:
+        for op in ops:
+            if verbose:
+                for line in op.describe(row):
+                    print(f"  - {line}")
+            data = op.apply(data, row)
+        return data
+    edit_file(file_path, edit, row, dry_run, writes=writes)
+
+def generate_case_editor(plan: Plan) -> CaseEditor:
+    """
+    Specialize the plan into Python source with every file path, key and column inlined,
+    and compile it into edit_case(row, dest, dry_run, writes). Equivalent to looping the plan with
+    apply_updates_to_file (without verbose output), minus the per-row loop and op dispatch.
+    Each file gets its own _edit_<i>(data, row) function, run through edit_file.
+    """
+    ns: Dict[str, Any] = {
+        "_join": os.path.join,
+        "_exists": os.path.exists,
+        "_edit_file": edit_file,
+        "_set_foam_key": set_foam_key,
+        "_set_foam_keys": set_foam_keys,
+        "_apply_regex": apply_regex,
+    }
+    lines = []
+    body = ["def edit_case(row, dest, dry_run, writes=None):"]
+    for i, (rel, ops) in enumerate(plan):
+        if not ops:
+            continue
+        lines.append(f"def _edit_{i}(data, row):")
+        for j, op in enumerate(ops):
+            pat = f"_P{i}_{j}"
+            ns[pat] = op.pattern
+            if isinstance(op, KeyOp):
+                lines.append(f"    data = _set_foam_key(data, {op.key!r}, row[{op.col}].encode('utf-8'), {pat}, {op.simple!r})")
+            elif isinstance(op, MultiKeyOp):
+                values = ", ".join(f"{key!r}: row[{col}].encode('utf-8')" for key, col in op.cols.items())
+                lines.append(f"    data = _set_foam_keys(data, {{{values}}}, {pat}, {op.simple!r})")
+            else:
+                lines.append(f"    data = _apply_regex(data, {pat}, {op.replacement!r}, {op.params_map!r}, row)")
+        lines.append("    return data")
+        body += [
+            f"    path = _join(dest, {rel!r})",
+            "    if not _exists(path):",
+            "        raise FileNotFoundError(f'File not found in case: {path}')",
+            f"    _edit_file(path, _edit_{i}, row, dry_run, writes)",
+        ]
+    body.append("    return None")
+    lines += body
+    exec(compile("\n".join(lines) + "\n", "<foamBatchGen case editor>", "exec"), ns)
+    return ns["edit_case"]
+
+def build_case(case_name: str, row: Row, ref: Path, out_dir: Path, plan: Plan, overwrite: bool, dry_run: bool, verbose: bool, copy_jobs: int = 1, ref_blob: Optional[bytes] = None,
+               reflink: str = "never", editor: Optional[CaseEditor] = None,
+               link_dirs: Tuple[str, ...] = (), fsync: str = "never") -> None:
     dest = out_dir / case_name
     if verbose:
         print(f"\n==> Building case: {case_name}")
         print(f"    from: {ref}")
         print(f"    to  : {dest}")
     if not dry_run:
-        copy_reference_case(ref, dest, overwrite=overwrite)
-    for fdesc in mapping.get("files", []):
-        rel = fdesc["path"]
-        updates = fdesc.get("updates", [])
-        fpath = dest / rel
-        if not fpath.exists():
-            raise FileNotFoundError(f"File not found in case: {fpath}")
-        if verbose:
-            print(f" Editing: {rel}")
-        apply_updates_to_file(fpath, updates, row, dry_run=dry_run, verbose=verbose)
+        copy_reference_case(ref, dest, overwrite=overwrite, copy_jobs=copy_jobs, ref_blob=ref_blob,
+                            reflink=reflink, link_dirs=link_dirs)
+    # With an fsync mode, edits are collected and written together once every file of the
+    # case is done; otherwise each file is written as soon as it is edited
+    writes: Optional[PendingWrites] = [] if fsync != "never" else None
+    # Plain strings from here on: no Path object per file per case
+    dest_str = os.fspath(dest)
+    if editor is not None and not verbose:
+        editor(row, dest_str, dry_run, writes)
+    else:
+        for rel, ops in plan:
+            if not ops:
+                # Listed without updates: nothing to change, so do not read or write it
+                if verbose:
+                    print(f" Skipping: {rel} (no updates)")
+                continue
+            fpath = os.path.join(dest_str, rel)
+            if not os.path.exists(fpath):
+                raise FileNotFoundError(f"File not found in case: {fpath}")
+            if verbose:
+                print(f" Editing: {rel}")
+            apply_updates_to_file(fpath, ops, row, dry_run=dry_run, verbose=verbose, writes=writes)
+    if writes is not None and not dry_run:
+        write_case_files(writes, dest, fsync=fsync)
+
+def _init_worker(ref_blob: Optional[bytes], plan: Plan) -> None:
+    # Hand the reference snapshot and plan to each worker once, instead of pickling them with every task.
+    # Generated code is not picklable, so each worker compiles its own editor from the plan.
+    global _REF_BLOB, _CASE_EDITOR, _PLAN
+    _REF_BLOB = ref_blob
+    _PLAN = plan
+    _CASE_EDITOR = generate_case_editor(plan)
+
+def _build_case_worker(args: Tuple[str, Row, Path, Path, bool, bool, bool, int, str, Tuple[str, ...], str]) -> Tuple[str, Optional[str], str]:
+    """
+    Process-pool entry point: build one case and return (case_name, error message or None, log).
+    Errors are returned as strings so they cross the process boundary without pickling issues.
+    The case's --verbose output is captured and returned too, so main can print each case's
+    log in one piece instead of interleaving lines from concurrent workers.
+    """
+    case_name, row, ref, out_dir, overwrite, dry_run, verbose, copy_jobs, reflink, link_dirs, fsync = args
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            build_case(case_name, row, ref, out_dir, _PLAN, overwrite=overwrite, dry_run=dry_run, verbose=verbose,
+                       copy_jobs=copy_jobs, ref_blob=_REF_BLOB, reflink=reflink, editor=_CASE_EDITOR,
+                       link_dirs=link_dirs, fsync=fsync)
+    except Exception as e:
+        return case_name, str(e), log.getvalue()
+    return case_name, None, log.getvalue()
+
+def _imap_bounded(ex: Executor, fn: Callable[[Any], Any], iterable: Iterable[Any], max_pending: int) -> Iterator[Any]:
+    """
+    Like ex.map(fn, iterable), but keeps at most max_pending tasks in flight, so the input
+    is consumed as workers free up instead of being submitted all at once. Results are
+    yielded in input order.
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(ex.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 def main():
     ap = argparse.ArgumentParser(description="Generate OpenFOAM cases from a reference and a CSV")
@@ -186,7 +873,30 @@ def main():
     ap.add_argument("--overwrite", action="store_true", help="Overwrite existing case directories")
     ap.add_argument("--only", type=str, default="", help="Comma separated list of case_name to build")
     ap.add_argument("--verbose", action="store_true", help="Verbose output")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of cases to build in parallel")
+    ap.add_argument("--copy-jobs", type=int, default=1,
+                    help="Threads used to copy files within each case (e.g. min(32, 4*CPUs) for many small files)")
+    ap.add_argument("--tar-ref", action="store_true",
+                    help="Read the reference case once into memory (tar) and extract it into each case")
+    ap.add_argument("--reflink", choices=("auto", "always", "never"), default="auto",
+                    help="Clone reference files copy-on-write where the filesystem supports it (btrfs, xfs)")
+    ap.add_argument("--link-dirs", type=str, default="",
+                    help="Comma separated reference subdirectories to hard-link instead of copy (read-only data, e.g. constant/polyMesh)")
+    ap.add_argument("--fsync", choices=("never", "per-case", "per-file"), default="never",
+                    help="Make each case durable before moving on: never (OS decides), per-case (sync the whole case "
+                         "after all writes), or per-file (additionally sync each edited file as it is written)")
+    ap.add_argument("--regex-engine", choices=("re", "re2"), default="re",
+                    help="Engine for regex updates: Python's re, or linear-time RE2 (requires google-re2; "
+                         "not fully re-compatible, see README)")
     args = ap.parse_args()
+    if args.regex_engine == "re2" and _re2 is None:
+        ap.error("--regex-engine re2 requires the google-re2 package (pip install google-re2)")
+    if args.fsync != "never" and os.name != "posix":
+        ap.error("--fsync is only supported on POSIX systems")
+    if args.jobs < 1:
+        ap.error("--jobs must be >= 1")
+    if args.copy_jobs < 1:
+        ap.error("--copy-jobs must be >= 1")
 
     csv_path = Path(args.csv).expanduser().resolve()
     ref_path = Path(args.ref).expanduser().resolve()
@@ -194,24 +904,53 @@ def main():
     map_path = Path(args.map).expanduser().resolve()
 
     mapping = read_mapping(map_path)
-    rows = read_csv(csv_path)
+    fieldnames, rows = read_csv(csv_path)
+    plan = build_plan(mapping, fieldnames, regex_engine=args.regex_engine)
+    case_col = fieldnames.index("case_name")
+    try:
+        link_dirs = resolve_link_dirs(args.link_dirs, ref_path, plan)
+    except ValueError as e:
+        ap.error(str(e))
 
     if args.only:
         wanted = {x.strip() for x in args.only.split(",") if x.strip()}
-        rows = [r for r in rows if r["case_name"] in wanted]
-        if not rows:
+        rows = (r for r in rows if case_col < len(r) and r[case_col] in wanted)
+        first = next(rows, None)
+        if first is None:
             print("No matching case_name rows for --only selection", file=sys.stderr)
             sys.exit(1)
+        rows = itertools.chain([first], rows)
 
     out_path.mkdir(parents=True, exist_ok=True)
 
+    ref_blob = snapshot_reference_case(ref_path, exclude=link_dirs) if args.tar_ref and not args.dry_run else None
+
     errors = 0
-    for row in rows:
-        try:
-            build_case(row, ref_path, out_path, mapping, overwrite=args.overwrite, dry_run=args.dry_run, verbose=args.verbose)
-        except Exception as e:
-            errors += 1
-            print(f"[ERROR] {row.get('case_name','<unknown>')}: {e}", file=sys.stderr)
+    # Cases are built concurrently, so a repeated case_name would have two workers
+    # removing and copying the same directory at once; only its first row is built
+    seen = set()
+    def tasks():
+        nonlocal errors
+        for row in rows:
+            if len(row) < len(fieldnames):
+                errors += 1
+                print(f"[ERROR] {row[case_col] if case_col < len(row) else '<unknown>'}: "
+                      f"row has {len(row)} field(s), header has {len(fieldnames)}", file=sys.stderr)
+                continue
+            if row[case_col] in seen:
+                errors += 1
+                print(f"[ERROR] {row[case_col]}: duplicate case_name, only its first row is built", file=sys.stderr)
+                continue
+            seen.add(row[case_col])
+            yield (row[case_col], row, ref_path, out_path, args.overwrite, args.dry_run, args.verbose,
+                   args.copy_jobs, args.reflink, link_dirs, args.fsync)
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker, initargs=(ref_blob, plan)) as ex:
+        for case_name, err, log in _imap_bounded(ex, _build_case_worker, tasks(), max_pending=2 * args.jobs):
+            if log:
+                print(log, end="", flush=True)
+            if err is not None:
+                errors += 1
+                print(f"[ERROR] {case_name}: {err}", file=sys.stderr)
 
     if errors:
         print(f"\nCompleted with {errors} error(s).", file=sys.stderr)